@@ -1,32 +1,37 @@
 import inspect
-from typing import List, Union
+from typing import List, Dict, Tuple, Union, Any
 
 from . import logger
 
 
-def debug_responses(
-        requests: List[str], response_ids: List[Union[int, str]],
-        collect_id: str = '-') -> None:
-    source = inspect.currentframe().f_back.f_locals['self']
-    function = inspect.currentframe().f_back.f_code.co_name
-    expected_ids = list(range(0, len(requests)))
-    differences = list(set(expected_ids) - set(response_ids))
+def _source() -> Tuple[str, str]:
+    """Name of the calling PDU and function, only looked up once there is
+    something to log since accessing the frame locals is not free"""
+    frame = inspect.currentframe().f_back.f_back
+    return frame.f_locals['self'].name, frame.f_code.co_name
+
+
+def debug_responses_named(
+        requests: List[str], response_ids: List[str]):
+    differences = set(requests).difference(response_ids)
 
     if len(differences) > 0:
-        names = [requests[difference] for difference in differences]
+        name, function = _source()
         logger.debug(
-            f"({source.name}#{collect_id}) No {function} response for "
-            f"{', '.join(names)}")
+            f"({name}) No {function} response for {', '.join(differences)}")
 
 
-def debug_responses_named(
-        requests: List[str], response_ids: List[str]):
-    source = inspect.currentframe().f_back.f_locals['self']
-    function = inspect.currentframe().f_back.f_code.co_name
-    expected_ids = set(requests)
-    differences = list(set(expected_ids) - set(response_ids))
+def debug_bulk_responses(
+        requests: List[Dict[str, Any]], response_ids: List[Union[int, str]]):
+    response_ids = set(response_ids)
+    differences = [
+        request for request in requests
+        if request['json']['id'] not in response_ids]
 
     if len(differences) > 0:
+        name, function = _source()
+        names = [
+            f"{request['json']['method']} {request['rid'].rsplit('/', 1)[-1]}"
+            for request in differences]
         logger.debug(
-            f"({source.name}) No {function} response for "
-            f"{', '.join(differences)}")
+            f"({name}) No {function} response for {', '.join(names)}")
@@ -9,7 +9,7 @@ from prometheus_client.core import GaugeMetricFamily, CounterMetricFamily
 
 from . import logger
 from .interfaces import PDU, MetricFamily
-from .jsonrpc import RaritanAuth
+from .jsonrpc import RaritanAuth, shared_session
 
 
 # Measure collection time
@@ -24,21 +24,23 @@ class RaritanExporter:
         asyncio.run(self._setup())
 
     async def _setup(self):
-        await asyncio.gather(*[pdu.setup() for pdu in self.pdus])
+        async with shared_session():
+            await asyncio.gather(*[pdu.setup() for pdu in self.pdus])
 
     async def _read(self, collect_id: str = '-'):
         return await asyncio.gather(
             *[pdu.read(collect_id=collect_id) for pdu in self.pdus])
 
     def read(self, collect_id: str = '-') -> List[MetricFamily]:
-        pdus = asyncio.run(self._read())
+        pdus = asyncio.run(self._read(collect_id=collect_id))
         metrics = [metric for metrics in pdus for metric in metrics]
 
         # group metrics by family
         metric_family = dict()
         for metric in metrics:
-            if metric.name in metric_family.keys():
-                metric_family[metric.name].add(metric)
+            family = metric_family.get(metric.name)
+            if family is not None:
+                family.add(metric)
             else:
                 metric_family[metric.name] = MetricFamily(metric)
 
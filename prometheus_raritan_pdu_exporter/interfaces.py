@@ -1,5 +1,5 @@
 from __future__ import annotations
-from dataclasses import dataclass, field, InitVar
+from dataclasses import dataclass, field, fields, InitVar, MISSING
 from typing import Optional, Union, List, Dict, Any
 import logging
 import re
@@ -8,7 +8,46 @@ from . import (
     logger, EXPORTER_PREFIX, SENSORS_TYPES, SENSORS_UNITS,
     SENSORS_DESCRIPTION, SENSORS_GAUGES, SENSORS_COUNTERS)
 from .jsonrpc import Request, RaritanAuth, EmptyResponse
-from .debug import debug_responses, debug_responses_named
+from .debug import debug_responses_named, debug_bulk_responses
+
+# Sets of the exported sensor interfaces for membership tests
+_GAUGES = frozenset(SENSORS_GAUGES)
+_COUNTERS = frozenset(SENSORS_COUNTERS)
+_NUMERIC = _GAUGES | _COUNTERS
+
+# Patterns used to convert camelCase to snake_case
+_CAMEL_WORD = re.compile(r'(.)([A-Z][a-z]+)')
+_CAMEL_BOUNDARY = re.compile(r'([a-z0-9])([A-Z])')
+
+
+def _add_slots(cls: type) -> type:
+    """Recreate a dataclass with __slots__ for its fields, saving the
+    per-instance __dict__ (`@dataclass(slots=True)` requires Python 3.10).
+
+    Fields with a default that are excluded from __init__ are never set on
+    the instance and remain class attributes. Frozen classes get
+    __getstate__/__setstate__ so copy and pickle can restore the slots
+    despite the frozen __setattr__.
+    """
+    cls_dict = dict(cls.__dict__)
+    field_names = tuple(
+        f.name for f in fields(cls) if f.init or f.default is MISSING)
+    cls_dict['__slots__'] = field_names
+    for name in ('__dict__', '__weakref__', *field_names):
+        cls_dict.pop(name, None)
+
+    if cls.__dataclass_params__.frozen:
+        def __getstate__(self) -> list:
+            return [getattr(self, name) for name in field_names]
+
+        def __setstate__(self, state: list) -> None:
+            for name, value in zip(field_names, state):
+                object.__setattr__(self, name, value)
+
+        cls_dict['__getstate__'] = __getstate__
+        cls_dict['__setstate__'] = __setstate__
+
+    return type(cls)(cls.__name__, cls.__bases__, cls_dict)
 
 
 class InterfaceError(Exception):
@@ -39,12 +78,21 @@ class PDU:
     n_devices: int = field(init=False, default=0)
     n_poles: int = field(init=False, default=0)
 
+    # readings are requested for the same sensors with the same ids on
+    # every read, so the bulk request is built and serialized during setup
+    _read_requests: list[Dict[str, Any]] = field(
+        default_factory=list, init=False, repr=False)
+    _read_body: Optional[bytes] = field(
+        default=None, init=False, repr=False)
+
     def __post_init__(self):
         super().__setattr__('name', self.auth.name)
 
     async def setup(self):
-        await self._connectors()
-        await self._sensors()
+        connectors = await self._connector_rids()
+        sensors = await self._connector_details(connectors)
+        sensors = await self._sensor_metadata(sensors)
+        self.sensors = [Sensor(**sensor) for sensor in sensors]
 
         self.n_poles = len(self.poles)
         self.n_sensors = len(self.sensors)
@@ -53,14 +101,20 @@ class PDU:
             [c for c in self.connectors if c.type == 'outlet'])
         self.n_devices = len(
             [c for c in self.connectors if c.type == 'device'])
+        self._read_requests = [
+            Request.bulk_request(rid=sensor.rid, method='getReading', id=i)
+            for i, sensor in enumerate(self.sensors)]
+        self._read_body = Request(
+            self.auth, requests=self._read_requests).body
         logger.info(self)
 
     async def read(self, collect_id: str = '-') -> list[Metric]:
         """Request sensor readings"""
         metrics = []
-        request = Request(self.auth, collect_id=collect_id)
-        for i, sensor in enumerate(self.sensors):
-            request.add(rid=sensor.rid, method='getReading', id=i)
+        debug = logger.isEnabledFor(logging.DEBUG)
+        request = Request(
+            self.auth, collect_id=collect_id, requests=self._read_requests,
+            body=self._read_body)
 
         try:
             result = await request.send()
@@ -69,44 +123,32 @@ class PDU:
                 f'({self.name}#{collect_id}) Uncaught Exception: {exc}')
         else:
             # note: EmptyResponse return value is fine during reads
-            if len(self.sensors) > len(result.responses):
+            if debug and len(self.sensors) > len(result.responses):
                 logger.debug(
                     f'({self.name}#{collect_id}) API request returned '
                     f'{len(result.responses)} readings for '
                     f'{self.n_sensors} known sensors')
 
-            for resp in result.responses:
-                metric = Metric(
-                    sensor=self.sensors[int(resp.id)],
-                    value=resp.ret['value'],
+            sensors = self.sensors
+            metrics = [
+                Metric(
+                    sensor=sensors[resp.id], value=resp.ret['value'],
                     timestamp=resp.ret['timestamp'])
-                metrics.append(metric)
+                for resp in result.responses]
 
             # Debug: No responses received for these sensors
-            if logging.DEBUG >= logger.level:
-                debug_responses(
-                    requests=[s.name for s in self.sensors],
-                    response_ids=[resp.id for resp in result.responses],
-                    collect_id=collect_id)
+            if debug:
+                received = bytearray(len(sensors))
+                for resp in result.responses:
+                    received[resp.id] = 1
+                missing = [s.name for s, r in zip(sensors, received) if not r]
+                if missing:
+                    logger.debug(
+                        f"({self.name}#{collect_id}) No read response for "
+                        f"{', '.join(missing)}")
 
         return metrics
 
-    async def _connectors(self) -> None:
-        connectors = await self._connector_rids()
-        connectors = await self._connector_metadata(connectors)
-        connectors = await self._connector_settings(connectors)
-        self.connectors = [Connector(**c) for c in connectors]
-
-    async def _sensors(self) -> None:
-        if len(self.connectors) == 0:
-            raise ValueError('Cannot get sensors without connector meta-data')
-
-        sensors_pole = await self._sensors_from_poles()
-        sensors_con = await self._sensors_from_connectors(self.connectors)
-        sensors = [*sensors_pole, *sensors_con]
-        sensors = await self._sensor_metadata(sensors)
-        self.sensors = [Sensor(**sensor) for sensor in sensors]
-
     async def _connector_rids(self) -> List[Dict[str, Any]]:
         """get connector rids"""
         request = Request(self.auth)
@@ -126,146 +168,128 @@ class PDU:
             for response in result.responses]
 
         # Debug: No responses received for these connectors
-        if logging.DEBUG >= logger.level:
+        if logger.isEnabledFor(logging.DEBUG):
             debug_responses_named(
                 requests=['inlet', 'outlet', 'device'],
                 response_ids=[resp.id for resp in result.responses])
 
         return connectors
 
-    async def _connector_metadata(
+    async def _connector_details(
             self, connectors: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        request = Request(self.auth)
-        for i, c in enumerate(connectors):
-            if c['type'] == 'device':  # devices have no metadata
-                continue
-            request.add(rid=c['rid'], method='getMetaData', id=i)
-
-        result = await request.send()
-        if isinstance(result, EmptyResponse):
-            # EmptyResponses are not acceptable during setup
-            raise result.exception
-
-        for resp in result.responses:
-            connectors[resp.id]['id'] = resp.ret.get('label', None)
-
-        # Debug: No responses received for these connectors
-        if logging.DEBUG >= logger.level:
-            debug_responses(
-                requests=[
-                    c['rid'].rsplit('/', 1)[-1] for c in connectors
-                    if c['type'] != 'device'],
-                response_ids=[resp.id for resp in result.responses])
+        """get connector metadata, settings, poles and sensors
+
+        All methods only depend on the connector rids, so they are sent in
+        a single bulk request. Each method is given its own range of
+        request ids, and the responses are dispatched through a table
+        mapping each request id to its method and connector index.
+        """
+        if len(connectors) == 0:
+            raise ValueError('Cannot get sensors without connector meta-data')
 
-        return connectors
+        methods = {
+            'inlet': 'getSensors', 'outlet': 'getSensors',
+            'device': 'getDevice'}
+        settings_offset = len(connectors)
+        poles_offset = 2 * len(connectors)
+        sensors_offset = poles_offset + len(
+            [c for c in connectors if c['type'] == 'inlet'])
 
-    async def _connector_settings(
-            self, connectors: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        request = Request(self.auth)
+        targets = {}
+        inlet_id = poles_offset
         for i, c in enumerate(connectors):
-            request.add(rid=c['rid'], method='getSettings', id=i)
-
-        result = await request.send()
-        if isinstance(result, EmptyResponse):
-            # EmptyResponses are not acceptable during setup
-            raise result.exception
-
-        for resp in result.responses:
-            connectors[resp.id]['name'] = resp.ret.get('name', None)
-
-        # Debug: No responses received for these connectors
-        if logging.DEBUG >= logger.level:
-            from .debug import debug_responses
-            debug_responses(
-                requests=[c['rid'] for c in connectors],
-                response_ids=[resp.id for resp in result.responses])
-
-        return connectors
+            if c['type'] != 'device':  # devices have no metadata
+                targets[i] = ('getMetaData', i)
+            if c['type'] == 'inlet':
+                targets[inlet_id] = ('getPoles', i)
+                inlet_id += 1
+            targets[settings_offset + i] = ('getSettings', i)
+            targets[sensors_offset + i] = (methods[c['type']], i)
 
-    async def _sensors_from_poles(self) -> List[Dict[str, Any]]:
-        sensors = []
-        poles = []
-        inlets = [c for c in self.connectors if c.type == 'inlet']
         request = Request(self.auth)
-
-        for i, c in enumerate(inlets):
-            request.add(rid=c.rid, method='getPoles', id=i)
+        for id, (method, i) in sorted(targets.items()):
+            request.add(rid=connectors[i]['rid'], method=method, id=id)
 
         result = await request.send()
         if isinstance(result, EmptyResponse):
             # EmptyResponses are not acceptable during setup
             raise result.exception
 
+        poles = []
+        sensors = []
+        connector_sensors = []
         for resp in result.responses:
-            poles.append(Pole(
-                pdu=self, name=resp.ret['label'], id=resp.ret['nodeId']))
-
-            for name, ret in resp.ret.items():
-                non_metrics = ['label', 'line', 'nodeId']
-                if name not in non_metrics and ret is not None:
-                    sensors.append(
-                        dict(rid=ret['rid'], interface=ret['type'],
-                             parent=poles[-1], name=name))
+            method, i = targets[resp.id]
+            if method == 'getMetaData':
+                connectors[i]['id'] = resp.ret.get('label', None)
+            elif method == 'getSettings':
+                connectors[i]['name'] = resp.ret.get('name', None)
+            elif method == 'getPoles':
+                poles.append(Pole(
+                    pdu=self, name=resp.ret['label'], id=resp.ret['nodeId']))
+                sensors.extend(self._sensors_from_pole(poles[-1], resp.ret))
+            else:
+                # connector sensors need the connector metadata and settings
+                connector_sensors.append((i, resp.ret))
 
         self.poles = poles
+        self.connectors = [Connector(**c) for c in connectors]
+        for i, ret in connector_sensors:
+            sensors.extend(
+                self._sensors_from_connector(self.connectors[i], ret))
 
         # Debug: No responses received for these connectors
-        if logging.DEBUG >= logger.level:
-            debug_responses(
-                requests=[c.name for c in inlets],
+        if logger.isEnabledFor(logging.DEBUG):
+            debug_bulk_responses(
+                requests=request.requests,
                 response_ids=[resp.id for resp in result.responses])
 
         return sensors
 
-    async def _sensors_from_connectors(
-            self, connectors: List[Connector]) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _sensors_from_pole(
+            pole: Pole, ret: Dict[str, Any]) -> List[Dict[str, Any]]:
         sensors = []
-        methods = {
-            'inlet': 'getSensors', 'outlet': 'getSensors',
-            'device': 'getDevice'}
-        request = Request(self.auth)
-        for i, c in enumerate(connectors):
-            request.add(rid=c.rid, method=methods[c.type], id=i)
+        non_metrics = ['label', 'line', 'nodeId']
+        for name, sensor in ret.items():
+            if name not in non_metrics and sensor is not None:
+                sensors.append(dict(
+                    rid=sensor['rid'], interface=sensor['type'],
+                    parent=pole, name=name))
 
-        result = await request.send()
-        if isinstance(result, EmptyResponse):
-            # EmptyResponses are not acceptable during setup
-            raise result.exception
+        return sensors
 
-        for resp in result.responses:
-            connector = connectors[resp.id]
-            if connector.type == 'device':
-                if resp.ret is None:
+    @staticmethod
+    def _sensors_from_connector(
+            connector: Connector,
+            ret: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        sensors = []
+        if connector.type == 'device':
+            if ret is None:
+                return sensors
+
+            ret = ret.get('value', {}).get('device', None)
+            base_type = ret.get('type', '').split(':')[0]
+            if base_type not in _NUMERIC:
+                # ignore state sensors
+                return sensors
+
+            sensors.append(dict(
+                rid=ret['rid'], interface=ret['type'], parent=connector))
+
+        elif connector.type in ['inlet', 'outlet']:
+            for name, sensor in ret.items():
+                if sensor is None:
                     continue
 
-                ret = resp.ret.get('value', {}).get('device', None)
-                base_type = ret.get('type', '').split(':')[0]
-                if base_type not in [*SENSORS_GAUGES, *SENSORS_COUNTERS]:
+                base_type = sensor.get('type', '').split(':')[0]
+                if base_type not in _NUMERIC:
                     # ignore state sensors
                     continue
 
                 sensors.append(dict(
-                    rid=ret['rid'], interface=ret['type'], parent=connector))
-
-            elif connector.type in ['inlet', 'outlet']:
-                for name, ret in resp.ret.items():
-                    if ret is None:
-                        continue
-
-                    base_type = ret.get('type', '').split(':')[0]
-                    if base_type not in [*SENSORS_GAUGES, *SENSORS_COUNTERS]:
-                        # ignore state sensors
-                        continue
-
-                    sensors.append(dict(
-                        rid=ret['rid'], interface=ret['type'],
-                        parent=connector, name=name))
-
-        # Debug: No responses received for these connectors
-        if logging.DEBUG >= logger.level:
-            debug_responses(
-                requests=[c.name for c in connectors],
-                response_ids=[resp.id for resp in result.responses])
+                    rid=sensor['rid'], interface=sensor['type'],
+                    parent=connector, name=name))
 
         return sensors
 
@@ -282,19 +306,21 @@ class PDU:
             raise result.exception
 
         for resp in result.responses:
-            ret = resp.ret.get('type', {})
-            sensors[resp.id]['metric'] = ret.get('type', 0)
-            sensors[resp.id]['unit'] = ret.get('unit', 0)
+            sensor = sensors[resp.id]
+            ret = resp.ret.get('type') or {}
+            sensor['metric'] = ret.get('type', 0)
+            sensor['unit'] = ret.get('unit', 0)
 
         # Debug: No responses received for these sensors
-        if logging.DEBUG >= logger.level:
-            debug_responses(
-                requests=[s['rid'].rsplit('/', 1)[-1] for s in sensors],
+        if logger.isEnabledFor(logging.DEBUG):
+            debug_bulk_responses(
+                requests=request.requests,
                 response_ids=[resp.id for resp in result.responses])
 
         return sensors
 
 
+@_add_slots
 @dataclass(frozen=True)
 class Connector:
     pdu: PDU
@@ -305,12 +331,13 @@ class Connector:
 
     def __post_init__(self) -> None:
         if self.id is None:
-            super().__setattr__('id', self.rid.rsplit('/', 1)[-1])
+            object.__setattr__(self, 'id', self.rid.rsplit('/', 1)[-1])
 
         if self.name is None or self.name in ["''", '']:
-            super().__setattr__('name', self.id)
+            object.__setattr__(self, 'name', self.id)
 
 
+@_add_slots
 @dataclass(frozen=True)
 class Pole:
     pdu: PDU
@@ -320,9 +347,10 @@ class Pole:
 
     def __post_init__(self):
         if self.name is None or self.name in ["''", '']:
-            super().__setattr__('name', f'L{self.id}')
+            object.__setattr__(self, 'name', f'L{self.id}')
 
 
+@_add_slots
 @dataclass(frozen=True)
 class Sensor:
     rid: str
@@ -332,6 +360,10 @@ class Sensor:
     name: str = field(default=None)
     parent: Union[Pole, Connector] = field(default=None)
 
+    # metric properties, resolved once instead of for every reading
+    properties: Optional[tuple[str, ...]] = field(
+        init=False, repr=False, compare=False)
+
     def __post_init__(self, metric: int, unit: int):
         metric = SENSORS_TYPES[metric] if self.name is None else self.name
         metric = metric.lower()
@@ -339,15 +371,26 @@ class Sensor:
         name = f"{EXPORTER_PREFIX}_{metric}{'_'+unit if unit else ''}"
         interface = self.interface.split(':')[0]  # remove sensor version
 
-        if interface in SENSORS_GAUGES:
-            super().__setattr__('interface', 'gauge')
-        elif interface in SENSORS_COUNTERS:
-            super().__setattr__('interface', 'counter')
+        if interface in _GAUGES:
+            object.__setattr__(self, 'interface', 'gauge')
+        elif interface in _COUNTERS:
+            object.__setattr__(self, 'interface', 'counter')
             name += '_total'
         else:
             raise InterfaceError(self)
 
-        super().__setattr__('name', name)
+        object.__setattr__(self, 'name', name)
+
+        properties = None
+        if self.parent is not None:
+            # properties used for label values must be of type str
+            parent = self.parent
+            properties = (
+                str(name), str(self.interface), str(parent.pdu.name),
+                str(parent.name), str(parent.type), str(parent.id),
+                str(self.rid))
+
+        object.__setattr__(self, 'properties', properties)
 
         if metric == 'unspecified':
             logger.debug(f'Sensor \'{self.name}\' is of unspecified type')
@@ -355,11 +398,12 @@ class Sensor:
     @staticmethod
     def camel_to_snake(label: str) -> str:
         """Convert camelCase strings to snake_case"""
-        label = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', label)
-        label = re.sub('([a-z0-9])([A-Z])', r'\1_\2', label).lower()
+        label = _CAMEL_WORD.sub(r'\1_\2', label)
+        label = _CAMEL_BOUNDARY.sub(r'\1_\2', label).lower()
         return label
 
 
+@_add_slots
 @dataclass
 class Metric:
     sensor: InitVar[Sensor]
@@ -377,14 +421,8 @@ class Metric:
 
     def __post_init__(self, sensor: Sensor):
         """Extract properties from Sensor"""
-        # properties used for label values must be of type str
-        self.name = str(sensor.name)
-        self.interface = str(sensor.interface)
-        self.pdu = str(sensor.parent.pdu.name)
-        self.label = str(sensor.parent.name)
-        self.type = str(sensor.parent.type)
-        self.connector_id = str(sensor.parent.id)
-        self.sensor_rid = str(sensor.rid)
+        (self.name, self.interface, self.pdu, self.label, self.type,
+         self.connector_id, self.sensor_rid) = sensor.properties
 
     @property
     def is_numeric(self) -> bool:
@@ -396,12 +434,13 @@ class Metric:
         return False
 
 
+@_add_slots
 @dataclass
 class MetricFamily:
     metric: InitVar[Metric]
     name: str = field(init=False)
     interface: str = field(init=False)
-    description: str = field(init=False, default='none')
+    description: str = field(init=False)
     metrics: list = field(init=False, default_factory=list)
 
     def __post_init__(self, metric: Metric):
@@ -1,8 +1,9 @@
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field, InitVar
-from typing import Union, Dict, Any
-from urllib.parse import urljoin
+from typing import Union, List, Dict, Any
 from ssl import SSLCertVerificationError
-from urllib.parse import urlparse, urlunparse
+import json
 
 from aiohttp import (
     BasicAuth, ClientSession, ClientTimeout, TCPConnector, ServerTimeoutError)
@@ -11,6 +12,23 @@ from aiohttp.web import HTTPException
 from . import logger
 
 
+def _stdlib_json_dumps(obj: Any) -> bytes:
+    return json.dumps(obj).encode('utf-8')
+
+
+try:
+    # orjson is considerably faster on large bulk responses
+    from orjson import dumps as json_dumps, loads as json_loads
+except ImportError:
+    json_dumps, json_loads = _stdlib_json_dumps, json.loads
+
+# Maximum number of simultaneous connections in the client session pool
+POOL_LIMIT = 32
+
+# Client session shared by all requests sent from the current context
+_session = ContextVar('session', default=None)
+
+
 class JSONRPCError(Exception):
     def __init__(self, message: str, **kwargs):
         super().__init__(message)
@@ -47,36 +65,39 @@ class Responses(object):
     responses: list = field(init=False, default_factory=list)
 
     def __post_init__(self, json: dict):
-        if 'error' in json.keys():
+        if 'error' in json:
             raise JSONRPCError(json['error']['message'])
 
-        if 'result' not in json.keys():
+        if 'result' not in json:
             raise JSONRPCError('Missing \'result\' key in json')
 
         responses = json['result'].get('responses', [])
         if not responses:
             raise JSONRPCError('No responses returned')
 
+        # this loop runs for every reading, so avoid allocating defaults
+        append = self.responses.append
         for response in responses:
-            json = response.get('json', {})
+            json = response.get('json')
             if not json:
                 raise JSONRPCError('Missing \'json\' key in response')
 
-            id = json.get('id', None)
-            error = json.get('error', None)
+            id = json.get('id')
+            error = json.get('error')
             if error:
                 logger.error(f"Response (id: {id}): {error['message']}")
                 continue
 
-            ret = json.get('result', {}).get('_ret_', [])
+            result = json.get('result')
+            ret = result.get('_ret_') if result else None
             if not ret:
                 continue
 
             if isinstance(ret, list):
                 for ret_part in ret:
-                    self.responses.append(Response(id=id, ret=ret_part))
+                    append(Response(id=id, ret=ret_part))
             else:
-                self.responses.append(Response(id=id, ret=ret))
+                append(Response(id=id, ret=ret))
 
 
 @dataclass(frozen=True)
@@ -102,36 +123,68 @@ class RaritanAuth:
             # None uses default ssl verification in aiohttp.TCPConnector
             super().__setattr__('verify_ssl', None)
 
-        url = urlparse(self.url)
+        url = self.url if '://' in self.url else f'http://{self.url}'
 
-        if not url.scheme:
-            url._replace(scheme='http')
+        # keep only scheme and host, requests always go to the /bulk endpoint
+        scheme, _, netloc = url.partition('://')
+        for separator in '/?#':
+            netloc = netloc.split(separator, 1)[0]
 
         if self.name is None:
-            super().__setattr__('name', url.netloc)
+            super().__setattr__('name', netloc)
+
+        super().__setattr__('url', f'{scheme}://{netloc}')
+
+
+def client_session() -> ClientSession:
+    return ClientSession(
+        timeout=ClientTimeout(total=10),
+        headers={'Content-Type': 'application/json-rpc'},
+        connector=TCPConnector(limit=POOL_LIMIT))
 
-        super().__setattr__('url', urlunparse(url))
+
+@asynccontextmanager
+async def shared_session():
+    """Send all requests within this context through a single pooled
+    client session, so keep-alive connections are reused instead of
+    opening a new connection for every request"""
+    async with client_session() as session:
+        token = _session.set(session)
+        try:
+            yield session
+        finally:
+            _session.reset(token)
 
 
 class Request:
-    def __init__(self, auth: RaritanAuth, id: Any = 0, collect_id: str = None):
+    def __init__(
+            self, auth: RaritanAuth, id: Any = 0, collect_id: str = None,
+            requests: List[Dict[str, Any]] = None, body: bytes = None):
         self.auth = auth
         self.id = id
-        self.requests = []
+        self.requests = [] if requests is None else requests
         self.collect_id = collect_id
+        self._body = body  # pre-serialized json, if the requests are fixed
 
     def __repr__(self):
         return str(self.json)
 
     @staticmethod
     def request(method: str, id: Any, params: Dict[str, Any] = None):
-        return {
-            'jsonrpc': '2.0', 'method': method,
-            **({'params': params} if params else {}), 'id': id}
+        request = {'jsonrpc': '2.0', 'method': method}
+        if params:
+            request['params'] = params
+
+        request['id'] = id
+        return request
+
+    @classmethod
+    def bulk_request(
+            cls, rid: Union[str, int], method: str, id: Any) -> Dict[str, Any]:
+        return {'json': cls.request(method, id), 'rid': rid}
 
     def add(self, rid: Union[str, int], method: str, id: Any):
-        self.requests.append({
-            'json': self.request(method, id), 'rid': rid})
+        self.requests.append(self.bulk_request(rid, method, id))
 
     @property
     def json(self):
@@ -139,25 +192,42 @@ class Request:
             method='performBulk', params={'requests': self.requests},
             id=self.id)
 
+    @property
+    def body(self) -> bytes:
+        return json_dumps(self.json) if self._body is None else self._body
+
     async def send(self) -> Union[Responses, EmptyResponse]:
+        session = _session.get()
+        if session is None:
+            async with client_session() as session:
+                return await self._post(session)
+
+        return await self._post(session)
+
+    async def _post(
+            self, session: ClientSession) -> Union[Responses, EmptyResponse]:
         auth = self.auth
-        url = urljoin(auth.url, '/bulk')
+        url = f'{auth.url}/bulk'
         ssl = None if auth.verify_ssl else False
-
-        async with ClientSession(
-                timeout=ClientTimeout(total=10),
-                auth=BasicAuth(auth.user, auth.password, encoding='utf-8'),
-                headers={'Content-Type': 'application/json-rpc'},
-                connector=TCPConnector(ssl=ssl)) as session:
-
-            try:
-                async with session.post(url, json=self.json) as response:
-                    return Responses(await response.json())
-            except SSLCertVerificationError as exc:
-                logger.error(f'(#{self.collect_id}) {exc}')
-            except HTTPException as exc:
-                logger.warning(f'(#{self.collect_id}) {exc}')
-            except ServerTimeoutError as exc:
-                logger.warning(f'(#{self.collect_id}) {exc}')
-
-            return EmptyResponse(exception=exc)  # noqa: F821
+        basic_auth = BasicAuth(auth.user, auth.password, encoding='utf-8')
+
+        try:
+            async with session.post(
+                    url, data=self.body, auth=basic_auth,
+                    ssl=ssl) as response:
+                body = await response.read()
+        except SSLCertVerificationError as exc:
+            logger.error(f'(#{self.collect_id}) {exc}')
+            return EmptyResponse(exception=exc)
+        except HTTPException as exc:
+            logger.warning(f'(#{self.collect_id}) {exc}')
+            return EmptyResponse(exception=exc)
+        except ServerTimeoutError as exc:
+            logger.warning(f'(#{self.collect_id}) {exc}')
+            return EmptyResponse(exception=exc)
+
+        # skip the JSON parser for bodies that cannot contain any responses
+        if not body or body.isspace():
+            raise JSONRPCError('Empty response body')
+
+        return Responses(json_loads(body))
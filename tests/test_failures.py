@@ -32,7 +32,7 @@ def test_empty_response_connector_rids(
 @vcr.use_cassette(
     'tests/fixtures/vcr_cassettes/data.yaml',
     filter_headers=['authorization'])
-def test_empty_response_connector_metadata(
+def test_empty_response_connector_details(
         raritan_auth, test_exception, monkeypatch):
     """EmptyResponse returned during any of the setup steps"""
     async def mock_send(self):
@@ -44,61 +44,15 @@ def test_empty_response_connector_metadata(
     monkeypatch.setattr(Request, 'send', mock_send)
 
     with pytest.raises(test_exception):
-        _ = asyncio.run(pdu._connector_metadata(connectors))
+        _ = asyncio.run(pdu._connector_details(connectors))
 
 
-@vcr.use_cassette(
-    'tests/fixtures/vcr_cassettes/data.yaml',
-    filter_headers=['authorization'])
-def test_empty_response_connector_settings(
-        raritan_auth, test_exception, monkeypatch):
-    """EmptyResponse returned during any of the setup steps"""
-    async def mock_send(self):
-        response = EmptyResponse(exception=test_exception())
-        return response
-
-    pdu = PDU(auth=raritan_auth[0])
-    connectors = asyncio.run(pdu._connector_rids())
-    connectors = asyncio.run(pdu._connector_metadata(connectors))
-    monkeypatch.setattr(Request, 'send', mock_send)
-
-    with pytest.raises(test_exception):
-        _ = asyncio.run(pdu._connector_settings(connectors))
-
-
-@vcr.use_cassette(
-    'tests/fixtures/vcr_cassettes/data.yaml',
-    filter_headers=['authorization'])
-def test_empty_response_sensors_from_poles(
-        raritan_auth, test_exception, monkeypatch):
-    """EmptyResponse returned during any of the setup steps"""
-    async def mock_send(self):
-        response = EmptyResponse(exception=test_exception())
-        return response
-
+def test_connector_details_without_connectors(raritan_auth):
+    """Sensors cannot be requested without any connectors"""
     pdu = PDU(auth=raritan_auth[0])
-    monkeypatch.setattr(Request, 'send', mock_send)
 
-    with pytest.raises(test_exception):
-        _ = asyncio.run(pdu._sensors_from_poles())
-
-
-@vcr.use_cassette(
-    'tests/fixtures/vcr_cassettes/data.yaml',
-    filter_headers=['authorization'])
-def test_empty_response_sensors_from_connectors(
-        raritan_auth, test_exception, monkeypatch):
-    """EmptyResponse returned during any of the setup steps"""
-    async def mock_send(self):
-        response = EmptyResponse(exception=test_exception())
-        return response
-
-    pdu = PDU(auth=raritan_auth[0])
-    asyncio.run(pdu._connectors())
-    monkeypatch.setattr(Request, 'send', mock_send)
-
-    with pytest.raises(test_exception):
-        _ = asyncio.run(pdu._sensors_from_connectors(pdu.connectors))
+    with pytest.raises(ValueError):
+        _ = asyncio.run(pdu._connector_details([]))
 
 
 @vcr.use_cassette(
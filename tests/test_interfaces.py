@@ -1,5 +1,8 @@
 """Tests for prometheus_raritan_pdu_exporter/interfaces.py"""
 from unittest.mock import patch
+import copy
+import json
+import logging
 import time
 import fnmatch
 
@@ -10,7 +13,8 @@ import vcr
 from prometheus_raritan_pdu_exporter.interfaces import (
     InterfaceError, MetricMismatchError, PDU, Connector, Pole, Sensor, Metric,
     MetricFamily)
-from prometheus_raritan_pdu_exporter.jsonrpc import RaritanAuth
+from prometheus_raritan_pdu_exporter.jsonrpc import (
+    RaritanAuth, Request, EmptyResponse)
 from prometheus_raritan_pdu_exporter import (
     EXPORTER_PREFIX, SENSORS_TYPES, SENSORS_COUNTERS, SENSORS_GAUGES,
     SENSORS_UNITS, SENSORS_DESCRIPTION)
@@ -47,6 +51,8 @@ def test_pdu_setup(raritan_auth):
     assert len(pdu.connectors) == 101
     assert len(pdu.poles) == pdu.n_poles == 4
     assert len(pdu.sensors) == pdu.n_sensors > 0
+    assert len(pdu._read_requests) == pdu.n_sensors
+    assert isinstance(pdu._read_body, bytes)
 
     assert all(isinstance(c, Connector) for c in pdu.connectors)
     assert all(isinstance(p, Pole) for p in pdu.poles)
@@ -119,6 +125,61 @@ def test_pdu_read(raritan_auth):
     assert metric.timestamp is not None
 
 
+@vcr.use_cassette(
+    'tests/fixtures/vcr_cassettes/data.yaml',
+    filter_headers=['authorization'])
+def test_pdu_read_debug(raritan_auth, caplog):
+    """debug diagnostics are logged when debug logging is enabled"""
+    caplog.set_level(logging.DEBUG, logger='prometheus_raritan_pdu_exporter')
+    pdu = PDU(auth=raritan_auth[0])
+    asyncio.run(pdu.setup())
+    metrics = asyncio.run(pdu.read())
+
+    assert metrics
+    assert any(
+        record.levelno == logging.DEBUG and pdu.name in record.getMessage()
+        for record in caplog.records)
+
+
+@vcr.use_cassette(
+    'tests/fixtures/vcr_cassettes/data.yaml',
+    filter_headers=['authorization'])
+def test_pdu_read_no_debug(raritan_auth, caplog):
+    """debug diagnostics are not evaluated when debug logging is disabled"""
+    caplog.set_level(logging.INFO, logger='prometheus_raritan_pdu_exporter')
+    pdu = PDU(auth=raritan_auth[0])
+    module = 'prometheus_raritan_pdu_exporter.interfaces'
+
+    with patch(f'{module}.debug_bulk_responses') as debug_bulk, \
+            patch(f'{module}.debug_responses_named') as debug_named:
+        asyncio.run(pdu.setup())
+        metrics = asyncio.run(pdu.read())
+
+    assert metrics
+    assert not debug_bulk.called
+    assert not debug_named.called
+    assert not any(
+        record.levelno == logging.DEBUG for record in caplog.records)
+
+
+def test_pdu_read_before_setup(raritan_auth):
+    """reads before setup send a valid, empty performBulk request"""
+    pdu = PDU(auth=raritan_auth[0])
+    sent = []
+
+    async def mock_send(self):
+        sent.append(json.loads(self.body))
+        return EmptyResponse(exception=Exception())
+
+    with patch.object(Request, 'send', mock_send):
+        metrics = asyncio.run(pdu.read())
+
+    assert not metrics
+    assert sent == [{
+        'jsonrpc': '2.0', 'method': 'performBulk',
+        'params': {'requests': []}, 'id': 0}]
+
+
 @pytest.mark.filterwarnings('ignore::UserWarning')
 @vcr.use_cassette(
     'tests/fixtures/vcr_cassettes/data.yaml',
@@ -144,6 +205,8 @@ def test_connector(raritan_auth):
     assert connector.id == '1'
     assert connector.name == '1'
     assert connector.__dataclass_params__.frozen
+    assert not hasattr(connector, '__dict__')
+    assert copy.deepcopy(connector) == connector
 
 
 def test_pole(raritan_auth):
@@ -155,6 +218,8 @@ def test_pole(raritan_auth):
     assert pole.name == 'L1'
     assert pole.type == 'pole'
     assert pole.__dataclass_params__.frozen
+    assert not hasattr(pole, '__dict__')
+    assert copy.deepcopy(pole) == pole
 
 
 def test_sensor(raritan_auth):
@@ -170,6 +235,10 @@ def test_sensor(raritan_auth):
     assert sensor.name == \
            f'{EXPORTER_PREFIX}_{SENSORS_TYPES[1]}_{SENSORS_UNITS[2]}'
     assert sensor.__dataclass_params__.frozen
+    assert not hasattr(sensor, '__dict__')
+    assert copy.deepcopy(sensor) == sensor
+    assert sensor.properties == (
+        sensor.name, 'gauge', pdu.name, '1', 'inlet', '1', '1')
 
     sensor = Sensor(
         rid='1', interface=SENSORS_COUNTERS[0], metric=1, unit=0,
@@ -209,6 +278,7 @@ def test_metric(raritan_auth):
     assert metric.type == sensor.parent.type
     assert metric.connector_id == sensor.parent.id
     assert metric.sensor_rid == sensor.rid
+    assert not hasattr(metric, '__dict__')
     assert metric.is_numeric
     metric.value = None
     assert not metric.is_numeric
@@ -232,6 +302,7 @@ def test_metric_family(raritan_auth):
         f'{EXPORTER_PREFIX}_voltage_volt']
     assert len(family.metrics) == 1
     assert family.metrics[0] is metric
+    assert not hasattr(family, '__dict__')
 
     metric2 = Metric(sensor=sensor, value=56.78, timestamp=time.time())
     family.add(metric2)
@@ -1,9 +1,13 @@
 """Tests for prometheus_raritan_pdu_exporter/jsonrpc.py"""
+import asyncio
+import json
+
 import pytest
 
+from prometheus_raritan_pdu_exporter import jsonrpc
 from prometheus_raritan_pdu_exporter.jsonrpc import (
     JSONRPCError, MultiResponseError, Response, Responses, RaritanAuth,
-    Request)
+    Request, shared_session, _session)
 
 
 def test_response():
@@ -33,6 +37,11 @@ def test_responses_errors():
     with pytest.raises(JSONRPCError):
         Responses(json=json)
 
+    # missing 'json' key in response
+    json = {'result': {'responses': [{'statcode': 200}]}}
+    with pytest.raises(JSONRPCError):
+        Responses(json=json)
+
 
 def test_responses_single():
     """correct bulk result with single response should pass"""
@@ -128,6 +137,16 @@ def test_raritan_auth():
         verify_ssl=True)
     assert auth.verify_ssl is None
 
+    # scheme defaults to http, any path is dropped
+    auth = RaritanAuth(
+        name='foo', url='127.0.0.1:9840/', user='admin', password='xxx')
+    assert auth.url == 'http://127.0.0.1:9840'
+
+    for url in ('https://pdu/index.html', 'https://pdu/ui/', 'https://pdu?a'):
+        auth = RaritanAuth(
+            name='foo', url=url, user='admin', password='xxx')
+        assert auth.url == 'https://pdu'
+
 
 def test_request_init():
     auth = RaritanAuth(
@@ -138,9 +157,34 @@ def test_request_init():
     assert isinstance(request.requests, list)
     assert not request.requests
 
+    requests = [Request.bulk_request(rid='unique_id/1', method='getFoo', id=1)]
+    request = Request(auth=auth, requests=requests)
+    assert request.requests is requests
+
+    # the body is serialized from the requests unless given
+    assert json.loads(request.body) == request.json
+    request = Request(auth=auth, requests=requests, body=b'{}')
+    assert request.body == b'{}'
+
 
 def test_request_request():
-    pass
+    expected = {'jsonrpc': '2.0', 'method': 'getFoo', 'id': 1}
+    assert Request.request(method='getFoo', id=1) == expected
+
+    expected = {
+        'jsonrpc': '2.0', 'method': 'getFoo', 'params': {'foo': 'bar'},
+        'id': 1}
+    request = Request.request(method='getFoo', id=1, params={'foo': 'bar'})
+    assert request == expected
+    assert list(request) == ['jsonrpc', 'method', 'params', 'id']
+
+
+def test_request_bulk_request():
+    expected = {
+        'json': {'jsonrpc': '2.0', 'method': 'getFoo', 'id': 1},
+        'rid': 'unique_id/1'}
+    assert Request.bulk_request(
+        rid='unique_id/1', method='getFoo', id=1) == expected
 
 
 def test_request_add():
@@ -159,3 +203,76 @@ def test_request_add():
     assert len(request.requests) == 2
     assert request.requests[1]['json'] == expected_json
     assert request.requests[1]['rid'] == 'unique_id/2'
+
+
+def test_shared_session():
+    async def run():
+        assert _session.get() is None
+        async with shared_session() as session:
+            assert _session.get() is session
+            assert session.connector.limit == 32
+        assert _session.get() is None
+        assert session.closed
+
+    asyncio.run(run())
+
+
+class MockResponse:
+    def __init__(self, body: bytes):
+        self.body = body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+    async def read(self):
+        return self.body
+
+
+class MockSession:
+    def __init__(self, body: bytes):
+        self.body = body
+        self.data = None
+
+    def post(self, url, data=None, **kwargs):
+        self.data = data
+        return MockResponse(self.body)
+
+
+def test_request_empty_body():
+    """empty bodies are rejected without invoking the JSON parser"""
+    auth = RaritanAuth(
+        name='foo', url='https://127.0.0.1:9840', user='admin', password='xxx')
+    request = Request(auth=auth)
+
+    with pytest.raises(JSONRPCError):
+        asyncio.run(request._post(MockSession(b' ')))
+
+
+@pytest.mark.parametrize('implementation', ['json', 'orjson'])
+def test_request_post_json(implementation, monkeypatch):
+    """requests and responses round-trip with either JSON implementation"""
+    if implementation == 'orjson':
+        orjson = pytest.importorskip('orjson')
+        dumps, loads = orjson.dumps, orjson.loads
+    else:
+        dumps, loads = jsonrpc._stdlib_json_dumps, json.loads
+
+    monkeypatch.setattr(jsonrpc, 'json_dumps', dumps)
+    monkeypatch.setattr(jsonrpc, 'json_loads', loads)
+
+    auth = RaritanAuth(
+        name='foo', url='https://127.0.0.1:9840', user='admin', password='xxx')
+    request = Request(auth=auth)
+    request.add(rid='unique_id/1', method='getFoo', id=1)
+    session = MockSession(dumps({
+        'result': {'responses': [
+            {'json': {'id': 1, 'result': {'_ret_': {'foo': 'bär'}}}}]}}))
+
+    result = asyncio.run(request._post(session))
+    assert isinstance(session.data, bytes)
+    assert loads(session.data) == request.json
+    assert len(result.responses) == 1
+    assert result.responses[0].ret['foo'] == 'bär'